@@ -1,10 +1,16 @@
 import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.csv as pcsv
 import datetime
 import os
 from typing import List, Dict, Tuple, Optional
 import logging
 from collections import defaultdict
 import argparse
+import re
+from concurrent.futures import ProcessPoolExecutor
+import codecs
 
 # Set up logging for better debugging
 logging.basicConfig(
@@ -16,6 +22,54 @@ logging.basicConfig(
     ]
 )
 
+# Month selection entries: a number or a range such as "2-4"
+SELECTION_PATTERN = re.compile(r'(\d+)(?:\s*-\s*(\d+))?')
+
+# Transaction type flags stored in the TRKind column (IN and OUT may both be set)
+TR_OTHER = 0
+TR_IN = 1
+TR_OUT = 2
+
+# Minimum record count before monthly reports are built in worker processes;
+# below this, process start-up costs more than it saves
+PARALLEL_MIN_RECORDS = 50000
+
+# Substring patterns used to classify the TR column
+IN_PATTERNS = ['time in', 'in', 'entry', 'check in']
+OUT_PATTERNS = ['time out', 'out', 'exit', 'check out']
+
+# 'HH:MM' label for every minute of the day, indexed by minutes past midnight
+TIME_LABELS = np.array([f"{m // 60:02d}:{m % 60:02d}" for m in range(24 * 60)], dtype=object)
+
+# Day status indexed by how many of the IN/OUT times are set
+STATUS_LABELS = np.array(['A', 'E', 'P'], dtype=object)
+
+
+def minutes_of_day(times: pd.DataFrame) -> np.ndarray:
+    """Minutes past midnight for every timestamp in a frame, 0 where missing"""
+    values = times.to_numpy(dtype='datetime64[m]')
+    minutes = (values - values.astype('datetime64[D]')).astype('int64')
+    return np.where(np.isnat(values), 0, minutes)
+
+
+def write_csv(df: pd.DataFrame, filename: str):
+    """Write a DataFrame to CSV (without its index) using pyarrow's native writer"""
+    pcsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), filename)
+
+
+def month_key(month: str) -> int:
+    """Convert a YYYY-MM month label to the integer YearMonth key (e.g. 202501)"""
+    year, month_num = month.split('-')
+    return int(year) * 100 + int(month_num)
+
+
+def format_emp_id(emp_id) -> str:
+    """Format an employee ID as the zero-padded 8-character code used in reports"""
+    if isinstance(emp_id, (int, np.integer)):
+        return f"{emp_id:08d}"
+    return str(emp_id).zfill(8)
+
+
 class AttendanceReportGenerator:
     """
     Enhanced Attendance Report Generator with improved Excel formatting
@@ -26,6 +80,29 @@ class AttendanceReportGenerator:
         self.available_months = []
         self.employee_data = {}
         
+    def detect_encoding(self, input_file: str, sample_size: int = 65536) -> str:
+        """Pick the file encoding (UTF-8, cp1252 or latin1) from a bounded sample of its bytes"""
+        with open(input_file, 'rb') as f:
+            sample = f.read(sample_size)
+        
+        if sample.startswith(codecs.BOM_UTF8):
+            return 'utf-8-sig'
+        
+        # Most device exports are plain UTF-8. The incremental decoder tolerates a
+        # multi-byte character cut off at the end of the sample.
+        try:
+            codecs.getincrementaldecoder('utf-8')().decode(sample, final=False)
+            return 'utf-8'
+        except UnicodeDecodeError:
+            pass
+        
+        # Otherwise fall back to the Windows code page, then latin1 (which maps every byte)
+        try:
+            sample.decode('cp1252')
+            return 'cp1252'
+        except UnicodeDecodeError:
+            return 'latin1'
+    
     def read_attendance_file(self, input_file: str) -> bool:
         """Read and parse the attendance file with improved error handling"""
         print("--- Starting Attendance File Processing ---")
@@ -35,29 +112,23 @@ class AttendanceReportGenerator:
             # Define column names as per the original structure
             col_names = ['No', 'TMNo', 'EnNo', 'Name', 'GMNo', 'Mode', 'IN/OUT', 'Antipass', 'DaiGong', 'DateTime', 'TR']
             
-            # Read with multiple encoding attempts
-            encodings_to_try = ['utf-8', 'utf-8-sig', 'latin1', 'cp1252']
+            read_options = dict(sep='\t', header=None, names=col_names, skiprows=5, on_bad_lines='skip')
+            
+            # Sniff the encoding from a sample, then parse once with the C engine, which
+            # (unlike the pyarrow engine) keeps short rows and fills missing fields with NaN
+            encoding = self.detect_encoding(input_file)
+            
+            try:
+                self.df = pd.read_csv(input_file, encoding=encoding, engine='c', **read_options)
+            except UnicodeDecodeError:
+                # Only a decoding failure falls back to latin1, which maps every byte
+                logging.warning(f"Could not decode file as {encoding}, retrying with latin1")
+                encoding = 'latin1'
+                self.df = pd.read_csv(input_file, encoding=encoding, engine='c', **read_options)
+            
+            print(f"✅ Successfully read with {encoding} encoding")
+            logging.info(f"File read successfully with {encoding} encoding")
             
-            for encoding in encodings_to_try:
-                try:
-                    self.df = pd.read_csv(
-                        input_file, 
-                        sep='\t', 
-                        header=None, 
-                        names=col_names, 
-                        skiprows=5, 
-                        encoding=encoding,
-                        on_bad_lines='skip'
-                    )
-                    print(f"✅ Successfully read with {encoding} encoding")
-                    logging.info(f"File read successfully with {encoding} encoding")
-                    break
-                except UnicodeDecodeError:
-                    continue
-                    
-            if self.df is None:
-                raise Exception("Could not read file with any encoding")
-                
             print(f"📊 Raw records read: {len(self.df)}")
             logging.info(f"Raw records count: {len(self.df)}")
             
@@ -84,11 +155,16 @@ class AttendanceReportGenerator:
         original_count = len(self.df)
         
         # Clean string columns
-        string_columns = ['No', 'TMNo', 'EnNo', 'Name', 'GMNo', 'Mode', 'IN/OUT', 'Antipass', 'DaiGong', 'TR']
+        string_columns = ['No', 'TMNo', 'Name', 'GMNo', 'Mode', 'IN/OUT', 'Antipass', 'DaiGong', 'TR']
         for col in string_columns:
             if col in self.df.columns:
                 self.df[col] = self.df[col].astype(str).str.strip()
         
+        # Store low-cardinality columns as categoricals (small integer codes)
+        for col in ['Mode', 'IN/OUT', 'Antipass', 'DaiGong', 'TR']:
+            if col in self.df.columns:
+                self.df[col] = self.df[col].astype('category')
+        
         # Rename columns for clarity
         self.df.rename(columns={'EnNo': 'EmpID', 'Name': 'EmployeeName'}, inplace=True)
         
@@ -98,41 +174,34 @@ class AttendanceReportGenerator:
         
         # Parse DateTime with debugging
         print("🕐 Parsing DateTime...")
-        datetime_errors = []
-        
-        def parse_datetime_safe(dt_str):
-            """Safely parse datetime with error tracking"""
-            try:
-                if pd.isna(dt_str) or str(dt_str).strip() == '':
-                    return pd.NaT
-                
-                # Try multiple datetime formats
-                formats_to_try = [
-                    '%Y-%m-%d %H:%M:%S',
-                    '%d/%m/%Y %H:%M:%S',
-                    '%m/%d/%Y %H:%M:%S',
-                    '%Y/%m/%d %H:%M:%S',
-                    '%d-%m-%Y %H:%M:%S',
-                    '%Y-%m-%d %H:%M',
-                    '%d/%m/%Y %H:%M',
-                ]
-                
-                dt_str_clean = str(dt_str).strip()
-                
-                for fmt in formats_to_try:
-                    try:
-                        return pd.to_datetime(dt_str_clean, format=fmt)
-                    except:
-                        continue
-                
-                # If all formats fail, try pandas auto-parsing
-                return pd.to_datetime(dt_str_clean, errors='coerce')
-                
-            except Exception as e:
-                datetime_errors.append(f"Error parsing '{dt_str}': {str(e)}")
-                return pd.NaT
         
-        self.df['DateTime'] = self.df['DateTime'].apply(parse_datetime_safe)
+        # Try multiple datetime formats, each as one vectorized pass over
+        # the rows that are still unparsed
+        formats_to_try = [
+            '%Y-%m-%d %H:%M:%S',
+            '%d/%m/%Y %H:%M:%S',
+            '%m/%d/%Y %H:%M:%S',
+            '%Y/%m/%d %H:%M:%S',
+            '%d-%m-%Y %H:%M:%S',
+            '%Y-%m-%d %H:%M',
+            '%d/%m/%Y %H:%M',
+        ]
+        
+        dt_strings = self.df['DateTime'].astype(str).str.strip()
+        parsed = pd.to_datetime(dt_strings, format=formats_to_try[0], errors='coerce')
+        
+        for fmt in formats_to_try[1:]:
+            mask = parsed.isna()
+            if not mask.any():
+                break
+            parsed = parsed.fillna(pd.to_datetime(dt_strings[mask], format=fmt, errors='coerce'))
+        
+        # If all formats fail, try pandas auto-parsing on the leftovers only
+        mask = parsed.isna()
+        if mask.any():
+            parsed = parsed.fillna(pd.to_datetime(dt_strings[mask], format='mixed', errors='coerce'))
+        
+        self.df['DateTime'] = parsed
         
         # Remove rows with failed datetime parsing
         before_datetime_filter = len(self.df)
@@ -143,14 +212,31 @@ class AttendanceReportGenerator:
             print(f"⚠️  Failed to parse {datetime_failures} datetime entries")
             logging.warning(f"DateTime parsing failures: {datetime_failures}")
         
-        # Format EmpID consistently
-        self.df['EmpID'] = self.df['EmpID'].astype(str).str.zfill(8)
+        # Keep numeric EmpIDs as integers (cheap to group on); zero-padding is
+        # applied only when writing reports
+        numeric_ids = pd.to_numeric(self.df['EmpID'], errors='coerce')
+        if numeric_ids.notna().all() and (numeric_ids % 1 == 0).all():
+            self.df['EmpID'] = pd.to_numeric(self.df['EmpID'], downcast='integer')
+        else:
+            self.df['EmpID'] = self.df['EmpID'].astype(str).str.strip().str.zfill(8)
+        
+        # Classify IN/OUT once per TR category, then look up each row by its code
+        tr_lower = pd.Series(self.df['TR'].cat.categories).str.lower()
+        tr_kinds = (tr_lower.str.contains('|'.join(IN_PATTERNS), na=False) * TR_IN
+                    | tr_lower.str.contains('|'.join(OUT_PATTERNS), na=False) * TR_OUT)
+        tr_codes = self.df['TR'].cat.codes.to_numpy()
+        
+        # Missing TR values have code -1, which would index the last category
+        self.df['TRKind'] = np.where(tr_codes >= 0, tr_kinds.to_numpy()[tr_codes], TR_OTHER).astype('int8')
         
-        # Create YearMonth column for filtering
-        self.df['YearMonth'] = self.df['DateTime'].dt.strftime('%Y-%m')
+        # Calendar date of each record (kept as datetime64 for fast grouping)
+        self.df['Date'] = self.df['DateTime'].dt.normalize()
         
-        # Get unique months and sort them
-        self.available_months = sorted(self.df['YearMonth'].dropna().unique())
+        # Create YearMonth column for filtering as an integer key (e.g. 202501)
+        self.df['YearMonth'] = (self.df['DateTime'].dt.year * 100 + self.df['DateTime'].dt.month).astype('int32')
+        
+        # Get unique months, sort them and label them as YYYY-MM
+        self.available_months = [f"{ym // 100:04d}-{ym % 100:02d}" for ym in sorted(self.df['YearMonth'].unique())]
         
         print(f"✅ Data preprocessing complete!")
         print(f"📊 Final record count: {len(self.df)}")
@@ -173,6 +259,10 @@ class AttendanceReportGenerator:
         print("\n📅 Available Months for Report Generation:")
         print("=" * 50)
         
+        # Count records and employees for every month in one grouped pass
+        month_records_counts = self.df.groupby('YearMonth').size()
+        employees_counts = self.df.groupby('YearMonth')['EmpID'].nunique()
+        
         for i, month in enumerate(self.available_months, 1):
             try:
                 # Convert to readable format
@@ -181,8 +271,8 @@ class AttendanceReportGenerator:
                 month_names[month] = month_name
                 
                 # Count records for this month
-                month_records = len(self.df[self.df['YearMonth'] == month])
-                employees_count = self.df[self.df['YearMonth'] == month]['EmpID'].nunique()
+                month_records = month_records_counts[month_key(month)]
+                employees_count = employees_counts[month_key(month)]
                 
                 print(f"{i:2d}. {month_name:<15} ({month_records:4d} records, {employees_count:2d} employees)")
             except:
@@ -208,30 +298,22 @@ class AttendanceReportGenerator:
                 # Parse selection using set for efficient operations
                 selected_indices = set()
                 
-                # Split by comma and process each part
-                parts = [part.strip() for part in selection.split(',')]
-                
-                for part in parts:
-                    if '-' in part and part.count('-') == 1:
-                        # Handle range (e.g., "1-3")
-                        try:
-                            start, end = map(int, part.split('-'))
-                            if 1 <= start <= len(self.available_months) and 1 <= end <= len(self.available_months):
-                                selected_indices.update(range(start, end + 1))
-                            else:
-                                print(f"⚠️  Invalid range: {part}")
-                        except ValueError:
-                            print(f"⚠️  Invalid range format: {part}")
+                # Each comma-separated part must be a number or a range (e.g. "2-4", "5 - 6")
+                for part in selection.split(','):
+                    part = part.strip()
+                    match = SELECTION_PATTERN.fullmatch(part)
+                    if not match:
+                        print(f"⚠️  Invalid input: {part}")
+                        continue
+                    
+                    start = int(match.group(1))
+                    end = int(match.group(2) or start)
+                    if 1 <= start <= len(self.available_months) and 1 <= end <= len(self.available_months):
+                        selected_indices.update(range(start, end + 1))
+                    elif match.group(2):
+                        print(f"⚠️  Invalid range: {part}")
                     else:
-                        # Handle single number
-                        try:
-                            num = int(part)
-                            if 1 <= num <= len(self.available_months):
-                                selected_indices.add(num)
-                            else:
-                                print(f"⚠️  Invalid month number: {num}")
-                        except ValueError:
-                            print(f"⚠️  Invalid input: {part}")
+                        print(f"⚠️  Invalid month number: {start}")
                 
                 if selected_indices:
                     # Convert indices to actual months using our hash map
@@ -254,16 +336,13 @@ class AttendanceReportGenerator:
             except Exception as e:
                 print(f"❌ Error in selection: {str(e)}")
     
-    def generate_monthly_report(self, month: str) -> Optional[pd.DataFrame]:
-        """Generate report for a specific month with simple row format per employee"""
-        print(f"\n📊 Processing: {month}")
-        logging.info(f"Generating report for month: {month}")
-        
-        # Filter data for the specific month
-        month_df = self.df[self.df['YearMonth'] == month].copy()
+    @staticmethod
+    def generate_monthly_report(month: str, month_df: pd.DataFrame) -> Optional[Tuple[pd.DataFrame, pd.DataFrame]]:
+        """Generate the report and attendance summary for a specific month in one pass.
         
+        This may run in a worker process, so progress is printed by the caller.
+        """
         if month_df.empty:
-            print(f"⚠️  No data found for {month}")
             return None
         
         # Get date range for the month
@@ -279,165 +358,106 @@ class AttendanceReportGenerator:
         # Generate all dates in the month
         all_days = pd.date_range(start=start_date, end=end_date, freq='D')
         
-        # Get unique employees for this month
-        employees = sorted(month_df[['EmpID', 'EmployeeName']].drop_duplicates().values.tolist())
-        
-        print(f"   📈 Processing {len(employees)} employees for {len(all_days)} days")
-        
-        # Initialize report data list
-        report_rows = []
-        
-        # Process each employee
-        for emp_id, emp_name in employees:
-            emp_records = month_df[month_df['EmpID'] == emp_id].copy()
-            
-            # Separate IN and OUT records with better pattern matching
-            in_patterns = ['time in', 'in', 'entry', 'check in']
-            out_patterns = ['time out', 'out', 'exit', 'check out']
-            
-            df_in = emp_records[emp_records['TR'].str.lower().str.contains('|'.join(in_patterns), na=False)]
-            df_out = emp_records[emp_records['TR'].str.lower().str.contains('|'.join(out_patterns), na=False)]
-            
-            # Group by date and get earliest IN and latest OUT
-            in_times = df_in.groupby(df_in['DateTime'].dt.date)['DateTime'].min()
-            out_times = df_out.groupby(df_out['DateTime'].dt.date)['DateTime'].max()
-            
-            # Create employee header row
-            employee_header = {
-                'Employee_Info': f"{emp_id} - {emp_name}",
-                'Detail_Type': 'Employee_Header'
-            }
-            
-            # Create data rows for this employee
-            attendance_data = []
-            in_time_data = []
-            out_time_data = []
-            status_data = []
-            dates_data = []
-            
-            for day in all_days:
-                date_key = day.date()
-                date_str = day.strftime('%d-%m-%Y')
-                
-                # Get times for this date
-                in_time = in_times.get(date_key)
-                out_time = out_times.get(date_key)
-                
-                # Format times
-                if pd.notna(in_time):
-                    in_time_str = in_time.strftime('%H:%M')
-                else:
-                    in_time_str = '00:00'
-                
-                if pd.notna(out_time):
-                    out_time_str = out_time.strftime('%H:%M')
-                else:
-                    out_time_str = '00:00'
-                
-                # Determine status
-                if in_time_str != '00:00' and out_time_str != '00:00':
-                    status = 'P'  # Present
-                elif in_time_str != '00:00' or out_time_str != '00:00':
-                    status = 'E'  # Early departure or incomplete record
-                else:
-                    status = 'A'  # Absent
-                
-                # Store data for this date
-                dates_data.append(date_str)
-                in_time_data.append(in_time_str)
-                out_time_data.append(out_time_str)
-                status_data.append(status)
-            
-            # Create rows for this employee
-            # Header row
-            header_row = {'Employee_Info': f"{emp_id} - {emp_name}", 'Detail_Type': 'Header'}
-            for i, date in enumerate(dates_data):
-                header_row[f'Day_{i+1:02d}'] = ''
-            report_rows.append(header_row)
-            
-            # In-Time row
-            in_row = {'Employee_Info': 'In-Time', 'Detail_Type': 'InTime'}
-            for i, in_time in enumerate(in_time_data):
-                in_row[f'Day_{i+1:02d}'] = in_time
-            report_rows.append(in_row)
-            
-            # Out-Time row  
-            out_row = {'Employee_Info': 'Out-Time', 'Detail_Type': 'OutTime'}
-            for i, out_time in enumerate(out_time_data):
-                out_row[f'Day_{i+1:02d}'] = out_time
-            report_rows.append(out_row)
-            
-            # Status row
-            status_row = {'Employee_Info': 'Status', 'Detail_Type': 'Status'}
-            for i, status in enumerate(status_data):
-                status_row[f'Day_{i+1:02d}'] = status
-            report_rows.append(status_row)
-            
-            # Date row
-            date_row = {'Employee_Info': 'Date', 'Detail_Type': 'Date'}
-            for i, date in enumerate(dates_data):
-                date_row[f'Day_{i+1:02d}'] = date
-            report_rows.append(date_row)
-            
-            # Add empty row for separation
-            empty_row = {'Employee_Info': '', 'Detail_Type': 'Separator'}
-            for i in range(len(dates_data)):
-                empty_row[f'Day_{i+1:02d}'] = ''
-            report_rows.append(empty_row)
-        
-        # Convert to DataFrame
-        report_df = pd.DataFrame(report_rows)
-        
-        # Reorder columns to have Employee_Info and Detail_Type first, then days in order
-        day_columns = [col for col in report_df.columns if col.startswith('Day_')]
-        day_columns.sort()
-        column_order = ['Employee_Info', 'Detail_Type'] + day_columns
-        report_df = report_df[column_order]
-        
-        return report_df
+        # Get unique employees for this month, sorted by ID
+        emp_df = month_df[['EmpID', 'EmployeeName']].drop_duplicates(subset='EmpID').sort_values('EmpID', kind='mergesort')
+        emp_ids = emp_df['EmpID'].to_numpy()
+        employees = list(zip(emp_ids, emp_df['EmployeeName'].to_numpy()))
+        
+        # Earliest IN and latest OUT per employee and date, for all employees at once
+        # (only the three columns involved are selected, not whole filtered rows)
+        time_columns = ['EmpID', 'Date', 'DateTime']
+        df_in = month_df.loc[(month_df['TRKind'] & TR_IN) != 0, time_columns]
+        df_out = month_df.loc[(month_df['TRKind'] & TR_OUT) != 0, time_columns]
+        in_times_by_emp = df_in.groupby(['EmpID', 'Date'])['DateTime'].min().unstack()
+        out_times_by_emp = df_out.groupby(['EmpID', 'Date'])['DateTime'].max().unstack()
+        
+        # Earliest IN / latest OUT as minutes past midnight on an employee x day grid
+        in_minutes = minutes_of_day(in_times_by_emp.reindex(index=emp_ids, columns=all_days))
+        out_minutes = minutes_of_day(out_times_by_emp.reindex(index=emp_ids, columns=all_days))
+        
+        # Format every cell with one table lookup ('00:00' when missing) and derive the
+        # status from how many of the two times are set: A (absent), E (early departure
+        # or incomplete record), P (present)
+        in_time_grid = TIME_LABELS[in_minutes]
+        out_time_grid = TIME_LABELS[out_minutes]
+        status_grid = STATUS_LABELS[(in_minutes != 0).astype('int8') + (out_minutes != 0)]
+        
+        # Preallocate the report: six rows per employee, two label columns plus one per day
+        rows_per_employee = 6
+        day_columns = [f'Day_{i+1:02d}' for i in range(len(all_days))]
+        report_data = np.full((rows_per_employee * len(employees), len(day_columns) + 2), '', dtype=object)
+        
+        # Calendar labels shared by every employee
+        dates_data = all_days.strftime('%d-%m-%Y').to_numpy()
+        
+        # Fill each employee's block of rows (header, In-Time, Out-Time, Status, Date and
+        # an empty separator; day cells default to ''). Row k of every block is the
+        # strided slice k::rows_per_employee, so shared labels and the date row are
+        # written once for all employees.
+        report_data[0::rows_per_employee, 0] = [f"{format_emp_id(emp_id)} - {emp_name}" for emp_id, emp_name in employees]
+        report_data[0::rows_per_employee, 1] = 'Header'
+        report_data[1::rows_per_employee, :2] = ['In-Time', 'InTime']
+        report_data[1::rows_per_employee, 2:] = in_time_grid
+        report_data[2::rows_per_employee, :2] = ['Out-Time', 'OutTime']
+        report_data[2::rows_per_employee, 2:] = out_time_grid
+        report_data[3::rows_per_employee, :2] = ['Status', 'Status']
+        report_data[3::rows_per_employee, 2:] = status_grid
+        report_data[4::rows_per_employee, :2] = ['Date', 'Date']
+        report_data[4::rows_per_employee, 2:] = dates_data
+        report_data[5::rows_per_employee, 1] = 'Separator'
+        
+        # Convert to DataFrame with Employee_Info and Detail_Type first, then days in order
+        report_df = pd.DataFrame(report_data, columns=['Employee_Info', 'Detail_Type'] + day_columns)
+        
+        # Summary statistics: a day counts as present if it has any attendance record
+        total_working_days = len(all_days)
+        present_days_by_emp = month_df.groupby('EmpID')['Date'].nunique()
+        present_days = present_days_by_emp.reindex(emp_ids).to_numpy()
+        
+        summary_df = pd.DataFrame({
+            'Employee_ID': [format_emp_id(emp_id) for emp_id in emp_ids],
+            'Employee_Name': [emp_name for _, emp_name in employees],
+            'Total_Working_Days': total_working_days,
+            'Present_Days': present_days,
+            'Absent_Days': total_working_days - present_days,
+            'Attendance_Percentage': [f"{round((days / total_working_days) * 100, 2)}%" for days in present_days.tolist()]
+        })
+        
+        return report_df, summary_df
     
-    def generate_summary_report(self, month: str) -> Optional[pd.DataFrame]:
-        """Generate a summary report with attendance statistics"""
-        month_df = self.df[self.df['YearMonth'] == month].copy()
-        
-        if month_df.empty:
-            return None
-        
-        # Get date range for the month
-        year, month_num = month.split('-')
-        start_date = datetime.datetime(int(year), int(month_num), 1)
+    @staticmethod
+    def report_month_progress(month: str, month_reports: Optional[Tuple[pd.DataFrame, pd.DataFrame]]):
+        """Print and log the progress lines for a generated monthly report"""
+        print(f"\n📊 Processing: {month}")
+        logging.info(f"Generating report for month: {month}")
         
-        if int(month_num) == 12:
-            end_date = datetime.datetime(int(year) + 1, 1, 1) - datetime.timedelta(days=1)
+        if month_reports is None:
+            print(f"⚠️  No data found for {month}")
         else:
-            end_date = datetime.datetime(int(year), int(month_num) + 1, 1) - datetime.timedelta(days=1)
-        
-        total_working_days = (end_date - start_date).days + 1
-        
-        # Get unique employees
-        employees = sorted(month_df[['EmpID', 'EmployeeName']].drop_duplicates().values.tolist())
-        
-        summary_data = []
-        
-        for emp_id, emp_name in employees:
-            emp_records = month_df[month_df['EmpID'] == emp_id].copy()
-            
-            # Count unique dates with attendance records
-            unique_dates = emp_records['DateTime'].dt.date.nunique()
-            present_days = unique_dates
-            absent_days = total_working_days - present_days
-            attendance_percentage = round((present_days / total_working_days) * 100, 2)
-            
-            summary_data.append({
-                'Employee_ID': emp_id,
-                'Employee_Name': emp_name,
-                'Total_Working_Days': total_working_days,
-                'Present_Days': present_days,
-                'Absent_Days': absent_days,
-                'Attendance_Percentage': f"{attendance_percentage}%"
-            })
-        
-        return pd.DataFrame(summary_data)
+            summary_report = month_reports[1]
+            total_days = summary_report['Total_Working_Days'].iloc[0]
+            print(f"   📈 Processing {len(summary_report)} employees for {total_days} days")
+    
+    def iter_monthly_reports(self, month_jobs: List[Tuple[str, pd.DataFrame]]):
+        """Yield (month, reports) in the given order, using worker processes for large multi-month runs"""
+        max_workers = min(len(month_jobs), max(1, (os.cpu_count() or 1) - 1))
+        selected_records = sum(len(month_df) for _, month_df in month_jobs)
+        
+        if max_workers > 1 and selected_records >= PARALLEL_MIN_RECORDS:
+            logging.info(f"Generating {len(month_jobs)} monthly reports with {max_workers} worker processes")
+            with ProcessPoolExecutor(max_workers=max_workers) as executor:
+                futures = [executor.submit(self.generate_monthly_report, month, month_df) for month, month_df in month_jobs]
+                for i, ((month, _), future) in enumerate(zip(month_jobs, futures), 1):
+                    month_reports = future.result()
+                    print(f"\n📊 Processing month {i}/{len(month_jobs)}: {month}")
+                    self.report_month_progress(month, month_reports)
+                    yield month, month_reports
+        else:
+            for i, (month, month_df) in enumerate(month_jobs, 1):
+                print(f"\n📊 Processing month {i}/{len(month_jobs)}: {month}")
+                month_reports = self.generate_monthly_report(month, month_df)
+                self.report_month_progress(month, month_reports)
+                yield month, month_reports
     
     def generate_reports(self, selected_months: List[str]):
         """Generate reports for selected months with enhanced Excel formatting"""
@@ -454,16 +474,19 @@ class AttendanceReportGenerator:
         # Generate Excel file with multiple sheets
         excel_filename = os.path.join(output_dir, "attendance_report.xlsx")
         
+        # Split the data by month once; only the selected months' rows are copied out,
+        # and both reports reuse the same sub-frame
+        month_positions = self.df.groupby('YearMonth', sort=False).indices
+        month_jobs = [(month, self.df.take(month_positions.get(month_key(month), []))) for month in selected_months]
+        
         try:
-            with pd.ExcelWriter(excel_filename, engine='openpyxl') as writer:
+            with pd.ExcelWriter(excel_filename, engine='xlsxwriter') as writer:
                 
-                for i, month in enumerate(selected_months, 1):
-                    print(f"\n📊 Processing month {i}/{len(selected_months)}: {month}")
-                    
-                    # Generate monthly report
-                    monthly_report = self.generate_monthly_report(month)
-                    
-                    if monthly_report is not None:
+                # Monthly reports may be built in parallel; sheets are still written in order
+                for month, month_reports in self.iter_monthly_reports(month_jobs):
+                    if month_reports is not None:
+                        monthly_report, summary_report = month_reports
+                        
                         # Create sheet name
                         year, month_num = month.split('-')
                         sheet_name = datetime.datetime(int(year), int(month_num), 1).strftime("%B-%Y")
@@ -474,19 +497,17 @@ class AttendanceReportGenerator:
                         
                         # Also create individual CSV
                         csv_filename = os.path.join(output_dir, f"report_{month}.csv")
-                        monthly_report.to_csv(csv_filename, index=False)
+                        write_csv(monthly_report, csv_filename)
                         print(f"   📄 CSV saved: {csv_filename}")
                         
-                        # Generate summary report
-                        summary_report = self.generate_summary_report(month)
-                        if summary_report is not None:
-                            summary_sheet_name = f"Summary-{sheet_name}"
-                            summary_report.to_excel(writer, sheet_name=summary_sheet_name, index=False)
-                            
-                            # Save summary CSV
-                            summary_csv = os.path.join(output_dir, f"summary_{month}.csv")
-                            summary_report.to_csv(summary_csv, index=False)
-                            print(f"   📈 Summary saved: summary_{month}.csv")
+                        # Write summary report
+                        summary_sheet_name = f"Summary-{sheet_name}"
+                        summary_report.to_excel(writer, sheet_name=summary_sheet_name, index=False)
+                        
+                        # Save summary CSV
+                        summary_csv = os.path.join(output_dir, f"summary_{month}.csv")
+                        write_csv(summary_report, summary_csv)
+                        print(f"   📈 Summary saved: summary_{month}.csv")
                     
             print(f"\n🎉 All reports generated successfully!")
             print(f"📁 Reports saved in: {output_dir}")